@@ -0,0 +1,96 @@
+"""
+Measure the throughput cost of compact mode when dumping a large tree.
+
+Dumps the same files with and without `--compact` reductions and reports
+throughput and bytes saved. By default a synthetic tree of Python modules is
+generated in a temporary directory; pass a directory to benchmark a real tree.
+
+Usage:
+    python benchmarks/bench_compact.py [DIRECTORY] [--files N] [--repeat N]
+"""
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from slopify.compact import CompactOptions
+from slopify.dumper import dump_files_to_markdown
+
+
+MODULE_TEMPLATE = '''\
+# Copyright 2023 Example Corp.
+# Licensed under the MIT License.
+"""Synthetic module {index}."""
+import os
+
+
+class Widget{index}:
+    """A widget."""
+
+    def __init__(self, size):  # constructor
+        """Store the size."""
+        self.size = size
+
+
+
+    def area(self):
+        # Square widgets only
+        return self.size * self.size   
+'''
+
+
+def generate_tree(directory: Path, n_files: int) -> list[Path]:
+    files = []
+    for index in range(n_files):
+        package = directory / f"package_{index % 20}"
+        package.mkdir(exist_ok=True)
+        file_path = package / f"module_{index}.py"
+        file_path.write_text(MODULE_TEMPLATE.format(index=index) * 10)
+        files.append(file_path)
+    return files
+
+
+def time_dump(files: list[Path], base_path: Path, repeat: int, compact=None):
+    best = float("inf")
+    content = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        content = dump_files_to_markdown(files, None, base_path, compact=compact)
+        best = min(best, time.perf_counter() - start)
+    return best, len(content.encode("utf-8"))
+
+
+def run(directory: Path, files: list[Path], repeat: int) -> None:
+    input_bytes = sum(f.stat().st_size for f in files)
+    print(f"{len(files)} files, {input_bytes / 1e6:.2f} MB")
+    for label, compact in [("plain", None), ("compact", CompactOptions())]:
+        seconds, output_bytes = time_dump(files, directory, repeat, compact)
+        print(
+            f"{label:>8}: {seconds:.3f} s, {input_bytes / 1e6 / seconds:.1f} MB/s, "
+            f"{output_bytes / 1e6:.2f} MB out"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", nargs="?", type=Path)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Per-file savings are logged at INFO, which would dominate the timings
+    logging.getLogger("slopify").setLevel(logging.WARNING)
+
+    if args.directory:
+        directory = args.directory.resolve()
+        files = [f for f in directory.rglob("*.py") if f.is_file()]
+        run(directory, files, args.repeat)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            run(directory, generate_tree(directory, args.files), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
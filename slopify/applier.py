@@ -4,6 +4,14 @@ from pydantic import BaseModel
 from markdown_it import MarkdownIt
 from pathlib import Path
 
+from .symbols import (
+    SYMBOL_SEPARATOR,
+    SymbolIndex,
+    build_symbol_index,
+    lookup_symbol,
+    splice_symbol,
+)
+
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -33,11 +41,14 @@ class FileContent(BaseModel):
         path (Path): The path where the file should be written.
         content (str): The main content to be written to the file.
         extra_content (str): Any additional content that is not part of the main content.
+        symbol (str, optional): A dotted symbol name (e.g. ``ClassName.method``) whose
+            span in the file should be replaced, instead of the whole file.
     """
 
     path: Path
     content: str
     extra_content: str = ""  # Additional attribute for extra content
+    symbol: ty.Optional[str] = None
 
 
 def parse_markdown_headings(markdown_text: str) -> dict[str, str]:
@@ -93,6 +104,8 @@ def create_file_contents_from_markdown(
     """
     Creates FileContent objects from a Markdown string where each H1 heading denotes a file path.
 
+    Headings of the form ``path.py::ClassName.method`` denote a single symbol within the file.
+
     Args:
         markdown_text (str): The Markdown text representing serialized files.
         base_path (str): The base path to be prefixed to each file path.
@@ -104,9 +117,11 @@ def create_file_contents_from_markdown(
     file_contents = []
 
     for heading, content in parsed_headings.items():
-        file_path = heading.strip("`")
+        file_path, separator, symbol = heading.strip("`").partition(SYMBOL_SEPARATOR)
         full_path = Path(base_path) / file_path
-        file_content = FileContent(path=full_path, content=content)
+        file_content = FileContent(
+            path=full_path, content=content, symbol=symbol if separator else None
+        )
         file_contents.append(file_content)
 
     return file_contents
@@ -151,10 +166,54 @@ def postprocess_content(file_content: FileContent) -> FileContent:
             extra_content = ""
 
     return FileContent(
-        path=file_content.path, content=processed_content, extra_content=extra_content
+        path=file_content.path,
+        content=processed_content,
+        extra_content=extra_content,
+        symbol=file_content.symbol,
     )
 
 
+def check_symbol_contents(file_contents: list[FileContent]):
+    """
+    Checks that every FileContent object naming a symbol can be spliced.
+
+    Each symbol must resolve to exactly one span of an existing, parseable
+    Python file. Running this before anything is written means a bad section
+    (e.g. a method the model renamed) cannot leave the codebase half-applied.
+
+    Args:
+        file_contents (list[FileContent]): A list of FileContent objects to be checked.
+
+    Raises:
+        ValueError: Listing every section that cannot be spliced.
+    """
+    problems = []
+    indexes: dict[Path, SymbolIndex] = {}
+    for file_content in file_contents:
+        file_path, symbol = file_content.path, file_content.symbol
+        if not symbol:
+            continue
+        if file_path.suffix != ".py":
+            problems.append(f"Symbol {symbol!r} needs a Python file, got {file_path}")
+            continue
+        try:
+            if file_path not in indexes:
+                indexes[file_path] = build_symbol_index(
+                    file_path.read_text(encoding="utf-8")
+                )
+            lookup_symbol(indexes[file_path], symbol, file_path)
+        except OSError as e:
+            problems.append(f"Cannot read {file_path}: {e.strerror}")
+        except SyntaxError as e:
+            problems.append(f"Cannot parse {file_path}: {e.msg} (line {e.lineno})")
+        except UnicodeDecodeError as e:
+            problems.append(f"Cannot read {file_path}: {e.reason}")
+        except (KeyError, ValueError) as e:
+            problems.append(e.args[0])
+    if problems:
+        raise ValueError("Cannot apply symbol sections:\n" + "\n".join(problems))
+
+
 def write_files(file_contents: list[FileContent]):
     """
     Writes the content of each FileContent object to the filesystem.
@@ -162,13 +221,24 @@ def write_files(file_contents: list[FileContent]):
     This function is responsible for creating any necessary directories and writing
     the file content to the specified paths. It also handles the special case of
     Markdown files, ensuring that any nested code blocks are correctly unescaped
-    before writing.
+    before writing. FileContent objects naming a symbol are spliced into that
+    symbol's span of the existing file rather than overwriting it; they are all
+    checked with `check_symbol_contents` before any file is written. Content is
+    written as given, so a section from a compacted dump replaces the file or
+    symbol without the comments and docstrings that compaction stripped.
 
     Args:
         file_contents (list[FileContent]): A list of FileContent objects to be written.
+
+    Raises:
+        ValueError: If a symbol section cannot be spliced. Nothing is written.
     """
+    check_symbol_contents(file_contents)
     for file_content in file_contents:
         file_path = file_content.path
+        if file_content.symbol:
+            splice_symbol(file_path, file_content.symbol, file_content.content)
+            continue
         file_path.parent.mkdir(
             parents=True, exist_ok=True
         )  # Create directories if needed
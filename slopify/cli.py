@@ -1,6 +1,8 @@
 import typer
 from .dumper import dump_files_to_markdown
 from .applier import apply_markdown
+from .compact import CompactOptions
+from .symbols import load_symbol_index, lookup_symbol, parse_selector
 from pathlib import Path
 import pathspec
 import pyperclip
@@ -19,8 +21,11 @@ def load_gitignore_patterns(directory: Path) -> pathspec.PathSpec:
 
 @app.command()
 def slop(
-    paths: list[Path] = typer.Argument(
-        ..., help="List of file paths or directories to dump.", exists=True
+    selectors: list[str] = typer.Argument(
+        ...,
+        help="List of file paths or directories to dump. Python files may be "
+        "narrowed to a single symbol with path.py::ClassName.method. A file "
+        "that is also selected whole (e.g. via its directory) is dumped whole.",
     ),
     output: Path = typer.Option(
         None, "--output", "-o", help="Output Markdown file name."
@@ -31,12 +36,53 @@ def slop(
         "-r",
         help="Recursively include files from subdirectories.",
     ),
+    compact: bool = typer.Option(
+        False,
+        "--compact",
+        "-c",
+        help="Apply every reduction below to shrink the dump.",
+    ),
+    strip_comments: bool = typer.Option(
+        False, "--strip-comments", help="Strip comments and docstrings (Python)."
+    ),
+    collapse_blank_lines: bool = typer.Option(
+        False, "--collapse-blank-lines", help="Collapse runs of blank lines."
+    ),
+    strip_trailing_whitespace: bool = typer.Option(
+        False, "--strip-trailing-whitespace", help="Strip trailing whitespace."
+    ),
+    strip_license: bool = typer.Option(
+        False, "--strip-license", help="Drop leading license/copyright headers."
+    ),
 ):
     gitignore_spec = load_gitignore_patterns(Path.cwd())
     files_to_dump = []
-    for path in paths:
+    symbols: dict[Path, list[str]] = {}
+    for selector in selectors:
+        try:
+            path, symbol = parse_selector(selector)
+        except ValueError as e:
+            raise typer.BadParameter(str(e))
+        if not path.exists():
+            raise typer.BadParameter(f"Path '{path}' does not exist.")
         path = path.resolve()
-        if path.is_dir():
+        if symbol:
+            if not path.is_file() or path.suffix != ".py":
+                raise typer.BadParameter(
+                    f"Symbol selector '{selector}' needs a Python file."
+                )
+            try:
+                lookup_symbol(load_symbol_index(path), symbol, path)
+            except SyntaxError as e:
+                raise typer.BadParameter(
+                    f"Cannot parse '{path}': {e.msg} (line {e.lineno})"
+                )
+            except UnicodeDecodeError as e:
+                raise typer.BadParameter(f"Cannot read '{path}': {e}")
+            except (KeyError, ValueError) as e:
+                raise typer.BadParameter(e.args[0])
+            symbols.setdefault(path, []).append(symbol)
+        elif path.is_dir():
             if recursive:
                 files = path.rglob("*")
             else:
@@ -46,16 +92,46 @@ def slop(
                     files_to_dump.append(file.resolve())
         elif path.is_file() and not gitignore_spec.match_file(path):
             files_to_dump.append(path.resolve())
+    # A file selected whole as well as by symbol is dumped whole
+    whole_files = set(files_to_dump)
+    symbols = {
+        path: list(dict.fromkeys(names))
+        for path, names in symbols.items()
+        if path not in whole_files
+    }
+    files_to_dump = list(dict.fromkeys(files_to_dump + list(symbols)))
+
+    reductions = {
+        "comments": strip_comments,
+        "blank_lines": collapse_blank_lines,
+        "trailing_whitespace": strip_trailing_whitespace,
+        "license_header": strip_license,
+    }
+    compact_options = None
+    if compact:
+        compact_options = CompactOptions()
+    elif any(reductions.values()):
+        compact_options = CompactOptions(**reductions)
 
     if output:
         output = output.resolve()
         files_to_dump = [f for f in files_to_dump if f != output]
         base_path = Path.cwd()
-        dump_files_to_markdown(files_to_dump, output, base_path=base_path)
+        dump_files_to_markdown(
+            files_to_dump,
+            output,
+            base_path=base_path,
+            symbols=symbols,
+            compact=compact_options,
+        )
         typer.echo(f"Dumped contents to {output}")
     else:
         markdown_content = dump_files_to_markdown(
-            files_to_dump, None, base_path=Path.cwd()
+            files_to_dump,
+            None,
+            base_path=Path.cwd(),
+            symbols=symbols,
+            compact=compact_options,
         )
         pyperclip.copy(markdown_content)
         typer.echo("Copied contents to clipboard")
@@ -73,15 +149,19 @@ def slather(
     base_path = base or Path.cwd()
     if markdown_file:
         markdown_content = markdown_file.read_text(encoding="utf-8")
-        apply_markdown(markdown_content, base_path=base_path)
-        typer.echo(f"Applied code from {markdown_file}")
+        source = str(markdown_file)
     else:
         markdown_content = pyperclip.paste()
-        if markdown_content:
-            apply_markdown(markdown_content, base_path=base_path)
-            typer.echo("Applied code from clipboard")
-        else:
+        source = "clipboard"
+        if not markdown_content:
             typer.echo("Clipboard is empty. No code was applied.", err=True)
+            return
+    try:
+        apply_markdown(markdown_content, base_path=base_path)
+    except ValueError as e:
+        typer.echo(f"{e}\nNo code was applied.", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(f"Applied code from {source}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,263 @@
+import io
+import re
+import token
+import tokenize
+import typing as ty
+from pydantic import BaseModel
+
+from .symbols import string_continuation_rows
+
+
+# Marks the spans removed from Python source, so lines left empty can be dropped
+_REMOVED = "\0"
+
+# PEP 263 encoding declaration, only honoured on the first two lines
+_CODING_PATTERN = re.compile(r"^[ \t\f]*#.*?coding[:=][ \t]*[-\w.]+")
+
+_LICENSE_PATTERN = re.compile(r"licen[cs]e|copyright|spdx", re.IGNORECASE)
+
+LINE_COMMENT_PREFIXES = {
+    "python": "#",
+    "bash": "#",
+    "ruby": "#",
+    "perl": "#",
+    "c": "//",
+    "cpp": "//",
+    "java": "//",
+    "go": "//",
+    "swift": "//",
+    "scala": "//",
+    "php": "//",
+    "csharp": "//",
+    "fsharp": "//",
+    "javascript": "//",
+    "typescript": "//",
+    "kotlin": "//",
+}
+
+BLOCK_COMMENT_LANGUAGES = {
+    "c",
+    "cpp",
+    "java",
+    "go",
+    "swift",
+    "scala",
+    "php",
+    "csharp",
+    "javascript",
+    "typescript",
+    "kotlin",
+    "css",
+}
+
+
+class CompactOptions(BaseModel):
+    """
+    The reductions applied to file contents when dumping in compact mode.
+
+    Attributes:
+        comments (bool): Strip comments and docstrings from Python files.
+        blank_lines (bool): Collapse runs of blank lines into a single blank line.
+        trailing_whitespace (bool): Strip trailing whitespace (except in Markdown,
+            where it is significant).
+        license_header (bool): Drop a leading comment block mentioning a license or copyright.
+    """
+
+    comments: bool = True
+    blank_lines: bool = True
+    trailing_whitespace: bool = True
+    license_header: bool = True
+
+
+def _is_string_statement(
+    tok: tokenize.TokenInfo, following: ty.Optional[tokenize.TokenInfo]
+) -> bool:
+    """
+    Whether a token starting a statement is a lone string literal safe to remove.
+    """
+    if tok.type != token.STRING or following is None:
+        return False
+    if following.type != token.NEWLINE:
+        return False
+    # An f-string is never a docstring, and evaluating one may have side effects
+    prefix = tok.string[: len(tok.string) - len(tok.string.lstrip("rRbBuUfF"))]
+    return "f" not in prefix.lower()
+
+
+def _is_directive_comment(tok: tokenize.TokenInfo) -> bool:
+    """
+    Whether a comment token is a shebang or an encoding declaration, which must be kept.
+    """
+    if tok.start[0] == 1 and tok.start[1] == 0 and tok.string.startswith("#!"):
+        return True
+    return tok.start[0] <= 2 and bool(_CODING_PATTERN.match(tok.line))
+
+
+def strip_python_comments(content: str) -> str:
+    """
+    Strip comments and docstrings from Python source using `tokenize`.
+
+    Docstrings are taken to be any statement consisting of a single string
+    literal other than an f-string. A leading shebang and an encoding
+    declaration are kept. Lines left empty by the removal are dropped. When
+    every statement of an indented block is removed, the last one is replaced
+    by ``...`` so the source stays valid.
+    Source that cannot be tokenized is returned unchanged.
+    """
+    if _REMOVED in content:
+        return content
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(content).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return content
+
+    significant = [tok for tok in tokens if tok.type not in (token.NL, token.COMMENT)]
+    removals: list[tuple[tokenize.TokenInfo, str]] = []
+    for tok in tokens:
+        if tok.type == token.COMMENT and not _is_directive_comment(tok):
+            removals.append((tok, _REMOVED))
+
+    # Per indented block: whether a statement survives, and the index in
+    # `removals` of the last string statement removed from it
+    blocks: list[tuple[bool, ty.Optional[int]]] = [(False, None)]
+    at_statement_start = True
+    for i, tok in enumerate(significant):
+        if tok.type == token.NEWLINE:
+            at_statement_start = True
+        elif tok.type == token.INDENT:
+            blocks.append((False, None))
+        elif tok.type == token.DEDENT:
+            survived, last_removed = blocks.pop()
+            if not survived and last_removed is not None:
+                removals[last_removed] = (removals[last_removed][0], "...")
+        elif at_statement_start and tok.type != token.ENDMARKER:
+            at_statement_start = False
+            following = significant[i + 1] if i + 1 < len(significant) else None
+            if _is_string_statement(tok, following):
+                blocks[-1] = (blocks[-1][0], len(removals))
+                removals.append((tok, _REMOVED))
+            else:
+                blocks[-1] = (True, blocks[-1][1])
+
+    lines = content.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+
+    pieces = []
+    position = 0
+    for tok, replacement in sorted(removals, key=lambda r: r[0].start):
+        start = offsets[tok.start[0] - 1] + tok.start[1]
+        pieces += [content[position:start], replacement]
+        position = offsets[tok.end[0] - 1] + tok.end[1]
+    pieces.append(content[position:])
+    result = "".join(pieces)
+
+    stripped_lines = []
+    for line in result.splitlines(keepends=True):
+        if _REMOVED in line:
+            line = line.replace(_REMOVED, "")
+            if not line.strip():
+                continue
+            line = line.rstrip() + "\n"
+        stripped_lines.append(line)
+    return "".join(stripped_lines)
+
+
+def collapse_blank_lines(
+    content: str, keep_rows: ty.AbstractSet[int] = frozenset()
+) -> str:
+    """
+    Collapse runs of blank lines into a single blank line and drop leading ones.
+
+    Rows in `keep_rows` (1-based, e.g. inside string literals) are left untouched.
+    """
+    collapsed = []
+    previous_blank = True
+    for row, line in enumerate(content.splitlines(keepends=True), start=1):
+        blank = row not in keep_rows and not line.strip()
+        if blank:
+            if previous_blank:
+                continue
+            line = "\n"
+        collapsed.append(line)
+        previous_blank = blank
+    return "".join(collapsed)
+
+
+def strip_trailing_whitespace(
+    content: str, keep_rows: ty.AbstractSet[int] = frozenset()
+) -> str:
+    """
+    Strip trailing whitespace from every line.
+
+    Rows in `keep_rows` (1-based, e.g. ending inside string literals) are left untouched.
+    """
+    if not keep_rows:
+        return re.sub(r"[ \t]+$", "", content, flags=re.MULTILINE)
+    stripped = []
+    for row, line in enumerate(content.splitlines(keepends=True), start=1):
+        if row not in keep_rows:
+            body = line.rstrip("\r\n")
+            line = body.rstrip(" \t") + line[len(body) :]
+        stripped.append(line)
+    return "".join(stripped)
+
+
+def strip_license_header(content: str, language: str) -> str:
+    """
+    Drop a leading comment block that mentions a license or copyright.
+
+    A shebang line is preserved. Languages without a known comment syntax are
+    returned unchanged.
+    """
+    shebang = ""
+    if content.startswith("#!"):
+        shebang, _, content = content.partition("\n")
+        shebang += "\n"
+
+    body = content.lstrip()
+    header = ""
+    if language in BLOCK_COMMENT_LANGUAGES and body.startswith("/*"):
+        end = body.find("*/")
+        if end != -1:
+            header = body[: end + 2]
+    elif language in LINE_COMMENT_PREFIXES:
+        prefix = LINE_COMMENT_PREFIXES[language]
+        header_lines = []
+        for line in body.splitlines(keepends=True):
+            if not line.lstrip().startswith(prefix):
+                break
+            header_lines.append(line)
+        header = "".join(header_lines)
+
+    if not header or not _LICENSE_PATTERN.search(header):
+        return shebang + content
+    return shebang + body[len(header) :].lstrip("\n")
+
+
+def compact_content(content: str, language: str, options: CompactOptions) -> str:
+    """
+    Apply the reductions enabled in `options` to the content of a file.
+
+    For Python, lines inside multi-line string literals are never collapsed or
+    stripped, so SQL, templates and expected outputs kept in strings survive.
+
+    :param content: The file content to compact.
+    :param language: The language of the file, as returned by `get_language`.
+    :param options: The reductions to apply.
+    :return: The compacted content.
+    """
+    if options.license_header:
+        content = strip_license_header(content, language)
+    if options.comments and language == "python":
+        content = strip_python_comments(content)
+    string_rows: set[int] = set()
+    if language == "python" and (options.trailing_whitespace or options.blank_lines):
+        string_rows = string_continuation_rows(content)
+    if options.trailing_whitespace and language != "markdown":
+        # A row ends inside a string when the next row starts inside one
+        content = strip_trailing_whitespace(content, {row - 1 for row in string_rows})
+    if options.blank_lines:
+        content = collapse_blank_lines(content, string_rows)
+    return content
@@ -1,6 +1,13 @@
 import typing as ty
+import logging
 from pathlib import Path
 
+from .compact import CompactOptions, compact_content
+from .symbols import SYMBOL_SEPARATOR, extract_symbol
+
+
+logger = logging.getLogger(__name__)
+
 
 def get_language(file_path: Path) -> str:
     extension_to_language = {
@@ -42,6 +49,9 @@ def dump_files_to_markdown(
     files: list[Path],
     output_file: ty.Optional[Path],
     base_path: ty.Optional[Path] = None,
+    symbols: ty.Optional[dict[Path, list[str]]] = None,
+    cache_dir: ty.Optional[Path] = None,
+    compact: ty.Optional[CompactOptions] = None,
 ) -> str:
     """
     Dump the contents of the given files to a Markdown file or return as a string.
@@ -50,10 +60,31 @@ def dump_files_to_markdown(
     :param output_file: A Path object pointing to the output Markdown file, or None.
     :param base_path: A Path object representing the base directory from
         which to calculate relative paths.
+    :param symbols: An optional mapping of file paths to dotted symbol names
+        (e.g. ``ClassName.method``). Files present in the mapping only have the
+        selected symbols emitted, each under a ``path::symbol`` heading.
+    :param cache_dir: The directory holding persisted symbol indexes.
+    :param compact: Optional reductions (comment, blank line, trailing whitespace
+        and license header stripping) applied to each file as it is dumped.
+        The bytes saved are logged per file.
     :return: The markdown content as a string if output_file is None, otherwise None.
     """
     base_path = base_path or Path.cwd()
     markdown_content = ""
+    total_saved = 0
+    compacted_files: set[Path] = set()
+
+    def compacted(content: str, file_path: Path, language: str, label: str) -> str:
+        nonlocal total_saved
+        if compact is None:
+            return content
+        reduced = compact_content(content, language, compact)
+        saved = len(content.encode("utf-8")) - len(reduced.encode("utf-8"))
+        total_saved += saved
+        compacted_files.add(file_path)
+        logger.info(f"Compacted {label}: saved {saved} bytes")
+        return reduced
+
     for file_path in sorted(files):
         # Skip the output file if it is specified and matches the current file path
         if output_file and file_path.resolve() == output_file.resolve():
@@ -61,14 +92,39 @@ def dump_files_to_markdown(
 
         relative_path = file_path.relative_to(base_path)
         language = get_language(file_path)
+        if symbols and file_path in symbols:
+            for symbol in symbols[file_path]:
+                content, start, end = extract_symbol(file_path, symbol, cache_dir)
+                content = compacted(
+                    content,
+                    file_path,
+                    language,
+                    f"{relative_path}{SYMBOL_SEPARATOR}{symbol}",
+                )
+                markdown_content += (
+                    f"# `{relative_path}{SYMBOL_SEPARATOR}{symbol}`\n\n"
+                    f"Lines {start}-{end} of `{relative_path}`.\n\n"
+                    f"```{language}\n{content}\n```\n\n"
+                )
+            continue
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = compacted(
+                file_path.read_text(encoding="utf-8"),
+                file_path,
+                language,
+                str(relative_path),
+            )
         except UnicodeDecodeError:
             content = "<binary file content not shown>"
         if file_path.suffix == ".md":
             content = escape_markdown_content(content)
         markdown_content += f"# `{relative_path}`\n\n```{language}\n{content}\n```\n\n"
 
+    if compact is not None:
+        logger.info(
+            f"Compacted {len(compacted_files)} files: saved {total_saved} bytes"
+        )
+
     if output_file:
         with output_file.open("w", encoding="utf-8") as md_file:
             md_file.write(markdown_content)
@@ -0,0 +1,242 @@
+import ast
+import hashlib
+import io
+import json
+import logging
+import os
+import token
+import tokenize
+import typing as ty
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+SYMBOL_SEPARATOR = "::"
+
+# Bump when the layout of persisted indexes changes, so stale caches are rebuilt
+_CACHE_VERSION = 2
+
+SymbolIndex = dict[str, list[tuple[int, int]]]
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the directory where per-file symbol indexes are persisted.
+
+    Honours ``XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "slopify" / "symbols"
+
+
+def parse_selector(selector: str) -> tuple[Path, ty.Optional[str]]:
+    """
+    Split a ``path.py::ClassName.method`` selector into its path and symbol.
+
+    :param selector: The selector string, with or without a symbol part.
+    :return: A tuple of the file path and the dotted symbol name, or None
+        if the selector refers to the whole file.
+    """
+    path, separator, symbol = selector.partition(SYMBOL_SEPARATOR)
+    if not separator:
+        return Path(selector), None
+    if not symbol:
+        raise ValueError(f"Empty symbol in selector: {selector!r}")
+    return Path(path), symbol
+
+
+def build_symbol_index(source: str) -> SymbolIndex:
+    """
+    Map the dotted name of every class and function in Python source to its line spans.
+
+    Spans are 1-based and inclusive, and start at the first decorator if any.
+    Nested definitions are qualified by their parents, e.g. ``Class.method``.
+    A name defined more than once (property setters, overloads, definitions in
+    ``if``/``else`` branches) has one span per definition, in source order.
+
+    :param source: The Python source code to index.
+    :return: A dictionary of dotted symbol names to lists of (start, end) line numbers.
+    """
+    index: SymbolIndex = {}
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = f"{prefix}{child.name}"
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                assert child.end_lineno is not None
+                index.setdefault(name, []).append((start, child.end_lineno))
+                visit(child, f"{name}.")
+            else:
+                visit(child, prefix)
+
+    visit(ast.parse(source), "")
+    return index
+
+
+def _cache_file(file_path: Path, cache_dir: Path) -> Path:
+    digest = hashlib.sha1(str(file_path.resolve()).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def load_symbol_index(
+    file_path: Path, cache_dir: ty.Optional[Path] = None
+) -> SymbolIndex:
+    """
+    Return the symbol index for a file, reusing the persisted copy while it is fresh.
+
+    The cached index is invalidated whenever the file's mtime or size changes.
+
+    :param file_path: A Path object pointing to the Python file to index.
+    :param cache_dir: The directory holding persisted indexes. Defaults to
+        :func:`default_cache_dir`.
+    :return: A dictionary of dotted symbol names to lists of (start, end) line numbers.
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    cache_file = _cache_file(file_path, cache_dir)
+    stat = file_path.stat()
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        if (
+            cached["version"] == _CACHE_VERSION
+            and cached["mtime_ns"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+        ):
+            return {
+                name: [(start, end) for start, end in spans]
+                for name, spans in cached["symbols"].items()
+            }
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    index = build_symbol_index(file_path.read_text(encoding="utf-8"))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "version": _CACHE_VERSION,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "symbols": index,
+                }
+            ),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.debug(f"Could not persist symbol index for {file_path}: {e}")
+    return index
+
+
+def lookup_symbol(index: SymbolIndex, symbol: str, file_path: Path) -> tuple[int, int]:
+    """
+    Return the line span of a symbol.
+
+    Raises a descriptive KeyError if the symbol is missing, and a ValueError if
+    it is defined more than once, since no single span can stand for it.
+    """
+    try:
+        spans = index[symbol]
+    except KeyError:
+        raise KeyError(f"Symbol {symbol!r} not found in {file_path}") from None
+    if len(spans) > 1:
+        lines = ", ".join(f"{start}-{end}" for start, end in spans)
+        raise ValueError(
+            f"Symbol {symbol!r} is ambiguous in {file_path}: defined at lines {lines}"
+        )
+    return spans[0]
+
+
+def string_continuation_rows(source: str) -> set[int]:
+    """
+    Return the 1-based rows of `source` that begin inside a multi-line string.
+
+    These rows must keep their exact leading whitespace when a symbol is
+    dedented or re-indented, and must not be touched by compaction. Source
+    that cannot be tokenized yields no rows.
+    """
+    rows: set[int] = set()
+    # Only triple quotes or a backslash-newline let a string span lines
+    if '"""' not in source and "'''" not in source and "\\\n" not in source:
+        return rows
+    fstring_starts: list[int] = []
+    fstring_start = getattr(token, "FSTRING_START", None)
+    fstring_end = getattr(token, "FSTRING_END", None)
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.type == fstring_start:
+                fstring_starts.append(tok.start[0])
+            elif tok.type == fstring_end and fstring_starts:
+                rows.update(range(fstring_starts.pop() + 1, tok.end[0] + 1))
+            elif tok.type == token.STRING:
+                rows.update(range(tok.start[0] + 1, tok.end[0] + 1))
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return rows
+
+
+def _leading_whitespace(line: str) -> str:
+    return line[: len(line) - len(line.lstrip(" \t"))]
+
+
+def extract_symbol(
+    file_path: Path, symbol: str, cache_dir: ty.Optional[Path] = None
+) -> tuple[str, int, int]:
+    """
+    Extract the source of a single symbol from a Python file.
+
+    The indentation of the symbol's first line is removed from every line of
+    the span that starts with it. Lines inside multi-line strings, and lines
+    indented less than the symbol (e.g. a column-0 comment), are kept verbatim.
+
+    :param file_path: A Path object pointing to the Python file.
+    :param symbol: The dotted symbol name, e.g. ``ClassName.method``.
+    :param cache_dir: The directory holding persisted symbol indexes.
+    :return: A tuple of the symbol's source and its (start, end) line numbers.
+    """
+    start, end = lookup_symbol(
+        load_symbol_index(file_path, cache_dir), symbol, file_path
+    )
+    source = file_path.read_text(encoding="utf-8")
+    lines = source.splitlines(keepends=True)
+    string_rows = string_continuation_rows(source)
+    indent = _leading_whitespace(lines[start - 1])
+    dedented = []
+    for row in range(start, end + 1):
+        line = lines[row - 1]
+        if row not in string_rows and line.startswith(indent):
+            line = line[len(indent) :]
+        dedented.append(line)
+    return "".join(dedented).rstrip("\n"), start, end
+
+
+def splice_symbol(file_path: Path, symbol: str, new_source: str) -> None:
+    """
+    Replace the span of a symbol in a Python file with new source.
+
+    The new source is indented by the symbol's current indentation, except
+    blank lines and lines inside multi-line strings. Source as emitted by
+    :func:`extract_symbol` round-trips unchanged unless it has lines indented
+    less than the symbol, such as column-0 comments or under-indented
+    continuation lines: those come back indented, which leaves the code
+    equivalent. The file is indexed afresh rather than through the cache,
+    since several symbols of the same file may be spliced in quick succession.
+
+    :param file_path: A Path object pointing to the Python file to modify.
+    :param symbol: The dotted symbol name, e.g. ``ClassName.method``.
+    :param new_source: The replacement source for the symbol.
+    """
+    source = file_path.read_text(encoding="utf-8")
+    start, end = lookup_symbol(build_symbol_index(source), symbol, file_path)
+    lines = source.splitlines(keepends=True)
+    indent = _leading_whitespace(lines[start - 1])
+    new_source = new_source.strip("\n") + "\n"
+    string_rows = string_continuation_rows(new_source)
+    replacement = []
+    for row, line in enumerate(new_source.splitlines(keepends=True), start=1):
+        if row not in string_rows and line.strip():
+            line = indent + line
+        replacement.append(line)
+    lines[start - 1 : end] = replacement
+    file_path.write_text("".join(lines), encoding="utf-8")
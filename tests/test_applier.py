@@ -1,4 +1,5 @@
 import pytest
+from textwrap import dedent
 from slopify.applier import apply_markdown, FileContent, write_files
 from pathlib import Path
 
@@ -104,3 +105,44 @@ print("Hello, nested world!")
     written_content = Path("nested_markdown.md").read_text()
     assert "```python" in written_content
     assert 'print("Hello, nested world!")' in written_content
+
+
+def test_apply_markdown_bad_symbol_sections_apply_nothing(tmp_path):
+    module = tmp_path / "m.py"
+    module.write_text("class A:\n    def f(self):\n        return 1\n")
+    markdown_content = dedent(
+        """\
+        # `other.py`
+
+        ```python
+        print('other')
+        ```
+
+        # `m.py::A.f`
+
+        ```python
+        def f(self):
+            return 2
+        ```
+
+        # `m.py::A.missing`
+
+        ```python
+        def missing(self):
+            pass
+        ```
+
+        # `gone.py::g`
+
+        ```python
+        def g():
+            pass
+        ```
+        """
+    )
+    with pytest.raises(ValueError) as excinfo:
+        apply_markdown(markdown_content, base_path=tmp_path)
+    assert "'A.missing' not found" in str(excinfo.value)
+    assert "Cannot read" in str(excinfo.value)
+    assert not (tmp_path / "other.py").exists()
+    assert module.read_text() == "class A:\n    def f(self):\n        return 1\n"
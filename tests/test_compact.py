@@ -0,0 +1,135 @@
+import ast
+from textwrap import dedent
+from slopify.compact import (
+    CompactOptions,
+    collapse_blank_lines,
+    compact_content,
+    strip_license_header,
+    strip_python_comments,
+    strip_trailing_whitespace,
+)
+
+
+PYTHON_SOURCE = dedent(
+    '''\
+    """Module docstring."""
+    import os  # trailing comment
+
+    # standalone comment
+    def documented():
+        """
+        A multi-line docstring.
+        """
+        return "not a docstring"
+
+
+    class OnlyDocstring:
+        """Nothing else here."""
+
+
+    def only_strings():
+        "one"
+        "two"
+
+
+    def generator(y):
+        f"y:{yield y * 2}"
+        "dropped"
+
+
+    def logs():
+        f"{log_call()}"
+    '''
+)
+
+
+def test_strip_python_comments():
+    stripped = strip_python_comments(PYTHON_SOURCE)
+    assert stripped == dedent(
+        """\
+        import os
+
+        def documented():
+            return "not a docstring"
+
+
+        class OnlyDocstring:
+            ...
+
+
+        def only_strings():
+            ...
+
+
+        def generator(y):
+            f"y:{yield y * 2}"
+
+
+        def logs():
+            f"{log_call()}"
+        """
+    )
+    ast.parse(stripped)
+
+
+def test_strip_python_comments_keeps_directives():
+    source = "#!/usr/bin/env python\n# -*- coding: utf-8 -*-\n# note\nx = 1\n"
+    assert strip_python_comments(source) == (
+        "#!/usr/bin/env python\n# -*- coding: utf-8 -*-\nx = 1\n"
+    )
+
+
+def test_strip_python_comments_invalid_source_unchanged():
+    source = "def broken(:\n    '''unterminated"
+    assert strip_python_comments(source) == source
+
+
+def test_collapse_blank_lines():
+    assert collapse_blank_lines("\n\na\n\n  \n\nb\n") == "a\n\nb\n"
+    assert collapse_blank_lines("a\n\n\n\nb\n", keep_rows={3, 4}) == "a\n\n\n\nb\n"
+
+
+def test_strip_trailing_whitespace():
+    assert strip_trailing_whitespace("a  \nb\t\n") == "a\nb\n"
+    assert strip_trailing_whitespace("a  \nb\t\n", keep_rows={1}) == "a  \nb\n"
+
+
+def test_strip_license_header():
+    python_source = (
+        "#!/usr/bin/env python\n# Copyright 2023 Someone\n# MIT License\n\nx = 1\n"
+    )
+    assert (
+        strip_license_header(python_source, "python")
+        == "#!/usr/bin/env python\nx = 1\n"
+    )
+    c_source = "/*\n * Licensed under the Apache License.\n */\nint x;\n"
+    assert strip_license_header(c_source, "c") == "int x;\n"
+    # Leading comments without a license are kept
+    assert strip_license_header("# helpers\nx = 1\n", "python") == "# helpers\nx = 1\n"
+    # Unknown languages are left alone
+    assert strip_license_header("# Copyright\n", "") == "# Copyright\n"
+
+
+def test_compact_content_keeps_python_strings():
+    source = "x = '''a  \n\n\n\nb \n'''  \n\n\n\ny = 1\n"
+    assert compact_content(source, "python", CompactOptions()) == (
+        "x = '''a  \n\n\n\nb \n'''\n\ny = 1\n"
+    )
+
+
+def test_compact_content_respects_options():
+    source = "# Copyright 2023\nx = 1  # one  \n\n\n\ny = 2\n"
+    assert compact_content(source, "python", CompactOptions()) == "x = 1\n\ny = 2\n"
+    only_blank_lines = CompactOptions(
+        comments=False, trailing_whitespace=False, license_header=False
+    )
+    assert compact_content(source, "python", only_blank_lines) == (
+        "# Copyright 2023\nx = 1  # one  \n\ny = 2\n"
+    )
+    # The shebang kept by license stripping survives comment stripping too
+    shebang_source = "#!/usr/bin/env python\n# Copyright 2023\nx = 1\n"
+    assert compact_content(shebang_source, "python", CompactOptions()) == (
+        "#!/usr/bin/env python\nx = 1\n"
+    )
+    # Trailing whitespace is a line break in Markdown
+    assert compact_content("a  \nb\n", "markdown", CompactOptions()) == "a  \nb\n"
@@ -1,5 +1,7 @@
+import logging
 from pathlib import Path
 import pytest
+from slopify.compact import CompactOptions
 from slopify.dumper import dump_files_to_markdown, get_language
 
 
@@ -87,3 +89,37 @@ def test_get_language_from_extension():
     assert get_language(Path("a.py")) == "python"  # Remove the dot from the extension
     assert get_language(Path("b.js")) == "javascript"
     # Add more assertions for different extensions
+
+
+def test_dump_files_to_markdown_symbols(tmp_path):
+    module = tmp_path / "module.py"
+    module.write_text("import os\n\n\nclass A:\n    def f(self):\n        return 1\n")
+    content = dump_files_to_markdown(
+        [module],
+        None,
+        base_path=tmp_path,
+        symbols={module: ["A.f"]},
+        cache_dir=tmp_path / "cache",
+    )
+    assert content == (
+        "# `module.py::A.f`\n\n"
+        "Lines 5-6 of `module.py`.\n\n"
+        "```python\n"
+        "def f(self):\n"
+        "    return 1\n"
+        "```\n\n"
+    )
+
+
+def test_dump_files_to_markdown_compact(tmp_path, caplog):
+    module = tmp_path / "module.py"
+    module.write_text('"""Docstring."""\n\n\n\nx = 1  # comment\n')
+    output_md = tmp_path / "output.md"
+    output_md.touch()
+    with caplog.at_level(logging.INFO, logger="slopify"):
+        content = dump_files_to_markdown(
+            [module, output_md], output_md, base_path=tmp_path, compact=CompactOptions()
+        )
+    assert content == "# `module.py`\n\n```python\nx = 1\n\n```\n\n"
+    assert "Compacted module.py: saved 31 bytes" in caplog.text
+    assert "Compacted 1 files: saved 31 bytes" in caplog.text
@@ -116,3 +116,21 @@ def test_slop_slather_escape_unescape_cycle(setup_test_files, tmp_path):
         assert (
             file_content == original_content or file_content == original_content + "\n"
         )
+
+
+def test_slop_slather_symbol_round_trip(tmp_path):
+    module = tmp_path / "module.py"
+    module.write_text(
+        "class A:\n    def f(self):\n        return 1\n\n    def g(self):\n        pass\n"
+    )
+    markdown_content = dump_files_to_markdown(
+        [module],
+        None,
+        base_path=tmp_path,
+        symbols={module: ["A.f"]},
+        cache_dir=tmp_path / "cache",
+    )
+    apply_markdown(markdown_content.replace("return 1", "return 2"), base_path=tmp_path)
+    assert module.read_text() == (
+        "class A:\n    def f(self):\n        return 2\n\n    def g(self):\n        pass\n"
+    )
@@ -0,0 +1,136 @@
+from textwrap import dedent
+from pathlib import Path
+import pytest
+from slopify.symbols import (
+    build_symbol_index,
+    extract_symbol,
+    load_symbol_index,
+    parse_selector,
+    splice_symbol,
+)
+
+
+@pytest.fixture
+def python_module(tmp_path):
+    module = tmp_path / "module.py"
+    module.write_text(
+        dedent(
+            """\
+            import os
+
+
+            def top_level():
+                return 1
+
+
+            class Greeter:
+                greeting = "hello"
+
+                @staticmethod
+                def greet(name):
+                    return f"hello {name}"
+
+                async def wave(self):
+                    pass
+            """
+        )
+    )
+    return module
+
+
+def test_parse_selector():
+    assert parse_selector("a/b.py") == (Path("a/b.py"), None)
+    assert parse_selector("a/b.py::Greeter.greet") == (Path("a/b.py"), "Greeter.greet")
+    with pytest.raises(ValueError):
+        parse_selector("a/b.py::")
+
+
+def test_build_symbol_index(python_module):
+    index = build_symbol_index(python_module.read_text())
+    assert index == {
+        "top_level": [(4, 5)],
+        "Greeter": [(8, 16)],
+        "Greeter.greet": [(11, 13)],  # Span starts at the decorator
+        "Greeter.wave": [(15, 16)],
+    }
+
+
+def test_load_symbol_index_invalidated_on_change(python_module, tmp_path):
+    cache_dir = tmp_path / "cache"
+    index = load_symbol_index(python_module, cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    assert load_symbol_index(python_module, cache_dir) == index
+
+    python_module.write_text("def only():\n    pass\n")
+    assert load_symbol_index(python_module, cache_dir) == {"only": [(1, 2)]}
+
+
+def test_extract_symbol(python_module, tmp_path):
+    content, start, end = extract_symbol(python_module, "Greeter.greet", tmp_path)
+    assert (start, end) == (11, 13)
+    assert content == (
+        "@staticmethod\n" "def greet(name):\n" '    return f"hello {name}"'
+    )
+    with pytest.raises(KeyError):
+        extract_symbol(python_module, "Greeter.missing", tmp_path)
+
+
+def test_splice_symbol_round_trip(python_module, tmp_path):
+    original = python_module.read_text()
+    content, _, _ = extract_symbol(python_module, "Greeter.greet", tmp_path)
+    splice_symbol(python_module, "Greeter.greet", content)
+    assert python_module.read_text() == original
+
+    splice_symbol(python_module, "Greeter.greet", "def greet(name):\n    return name")
+    assert "    def greet(name):\n        return name\n\n    async def" in (
+        python_module.read_text()
+    )
+    assert build_symbol_index(python_module.read_text())["Greeter.wave"] == [(14, 15)]
+
+
+def test_splice_symbol_round_trip_multiline_string(tmp_path):
+    module = tmp_path / "module.py"
+    original = 'class A:\n    def f(self):\n        return """\nmulti\n"""\n'
+    module.write_text(original)
+    content, _, _ = extract_symbol(module, "A.f", tmp_path / "cache")
+    assert content == 'def f(self):\n    return """\nmulti\n"""'
+    splice_symbol(module, "A.f", content)
+    assert module.read_text() == original
+
+
+def test_duplicate_symbol_is_ambiguous(tmp_path):
+    module = tmp_path / "module.py"
+    module.write_text(
+        dedent(
+            """\
+            class A:
+                @property
+                def x(self):
+                    return self._x
+
+                @x.setter
+                def x(self, value):
+                    self._x = value
+            """
+        )
+    )
+    assert build_symbol_index(module.read_text())["A.x"] == [(2, 4), (6, 8)]
+    with pytest.raises(ValueError, match="ambiguous"):
+        extract_symbol(module, "A.x", tmp_path / "cache")
+    with pytest.raises(ValueError, match="ambiguous"):
+        splice_symbol(module, "A.x", "def x(self):\n    pass")
+
+
+def test_splice_symbol_indents_under_indented_lines(tmp_path):
+    module = tmp_path / "module.py"
+    module.write_text(
+        "class A:\n    def f(self):\n# column-0 comment\n        x = (1 +\n  2)\n"
+    )
+    content, _, _ = extract_symbol(module, "A.f", tmp_path / "cache")
+    assert content == "def f(self):\n# column-0 comment\n    x = (1 +\n  2)"
+    splice_symbol(module, "A.f", content)
+    # Lines indented less than the symbol are not restored verbatim
+    assert module.read_text() == (
+        "class A:\n    def f(self):\n    # column-0 comment\n        x = (1 +\n      2)\n"
+    )
+    assert build_symbol_index(module.read_text())["A.f"] == [(2, 5)]